@@ -0,0 +1,157 @@
+"""
+Example: Using Portkey Gateway with asyncio and aiohttp
+
+The calls are pure network I/O, so this runs them concurrently on one event
+loop instead of one after another. uvloop is used when it is installed.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+URL = "http://localhost:8787/v1/chat/completions"
+
+# Configuration goes in the header
+HEADERS = {
+    "Content-Type": "application/json",
+    "x-portkey-config": json.dumps({
+        "provider": "openai",
+        "api_key": "dummy-key",
+        "custom_host": "http://localhost:8108/v1",
+        "inputMutators": [{
+            "langfuse.itsHub": {
+                "budget": 2
+            }
+        }]
+    })
+}
+
+RETRY_HEADERS = {
+    "Content-Type": "application/json",
+    "x-portkey-config": json.dumps({
+        "provider": "openai",
+        "api_key": "dummy-key",
+        "custom_host": "http://localhost:8108/v1",
+        "retry": {
+            "attempts": 3  # Retry up to 3 times on failure
+        },
+        "inputMutators": [{
+            "langfuse.itsHub": {
+                "budget": 2
+            }
+        }]
+    })
+}
+
+# SSE framing markers, kept as bytes so lines never need decoding
+SSE_DATA_PREFIX = b'data: '
+SSE_DONE = b'[DONE]'
+
+
+async def call_portkey_itshub(session):
+    """Call ITS-Hub through Portkey and return the completion text"""
+
+    data = {
+        "model": "gpt-4.1",
+        "messages": [
+            {"role": "user", "content": "What is the capital of England?"}
+        ]
+    }
+
+    async with session.post(URL, headers=HEADERS, json=data) as response:
+        if response.status != 200:
+            return f"Error: {response.status}\n{await response.text()}"
+        result = await response.json()
+
+    return result['choices'][0]['message']['content']
+
+
+async def call_portkey_with_retry(session):
+    """Example with Portkey's retry feature"""
+
+    data = {
+        "model": "gpt-4.1",
+        "messages": [
+            {"role": "user", "content": "Explain quantum computing briefly"}
+        ]
+    }
+
+    async with session.post(URL, headers=RETRY_HEADERS, json=data) as response:
+        result = await response.json()
+
+    return result['choices'][0]['message']['content']
+
+
+async def call_portkey_streaming(session):
+    """Example with streaming response
+
+    The deltas are collected rather than printed as they arrive so the output
+    does not interleave with the calls running alongside it.
+    """
+
+    data = {
+        "model": "gpt-4.1",
+        "messages": [
+            {"role": "user", "content": "Count from 1 to 5"}
+        ],
+        "stream": True  # Enable streaming
+    }
+
+    pieces = []
+    async with session.post(URL, headers=HEADERS, json=data) as response:
+        async for line in response.content:
+            line = line.strip()
+            if not line.startswith(SSE_DATA_PREFIX):
+                continue
+            data_bytes = line[len(SSE_DATA_PREFIX):]
+            if data_bytes == SSE_DONE:
+                continue
+            try:
+                chunk = json.loads(data_bytes)
+            except json.JSONDecodeError:
+                continue
+            content = chunk['choices'][0]['delta'].get('content')
+            if content:
+                pieces.append(content)
+
+    return ''.join(pieces)
+
+
+async def main():
+    # One pooled session shared by every call
+    connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            call_portkey_itshub(session),
+            call_portkey_with_retry(session),
+            call_portkey_streaming(session),
+        )
+
+    titles = ["Example 1: Basic Call", "Example 2: With Retry", "Example 3: Streaming"]
+    for title, content in zip(titles, results):
+        print(title)
+        print("-" * 60)
+        print(content)
+        print()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Portkey Gateway - asyncio Examples")
+    print("=" * 60)
+    print()
+
+    if uvloop is None:
+        asyncio.run(main())
+    elif hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        # uvloop < 0.18 has no run(); install its event loop policy instead
+        uvloop.install()
+        asyncio.run(main())
@@ -14,6 +14,20 @@ client = OpenAI(
     api_key="dummy-key"  # Placeholder, not used when routing to ITS-Hub
 )
 
+# Portkey config for routing to ITS-Hub, serialized once at import
+ITSHUB_HEADERS = {
+    "x-portkey-config": json.dumps({
+        "provider": "openai",
+        "api_key": "dummy-key",
+        "custom_host": "http://localhost:8108/v1",
+        "inputMutators": [{
+            "langfuse.itsHub": {
+                "budget": 2
+            }
+        }]
+    })
+}
+
 
 # Example 2: Use ITS-Hub through Portkey
 def example_itshub():
@@ -23,18 +37,7 @@ def example_itshub():
         messages=[
             {"role": "user", "content": "What is the capital of England?"}
         ],
-        extra_headers={
-            "x-portkey-config": json.dumps({
-                "provider": "openai",
-                "api_key": "dummy-key",
-                "custom_host": "http://localhost:8108/v1",
-                "inputMutators": [{
-                    "langfuse.itsHub": {
-                        "budget": 2
-                    }
-                }]
-            })
-        }
+        extra_headers=ITSHUB_HEADERS
     )
 
     print("ITS-Hub Response:")
@@ -42,8 +45,9 @@ def example_itshub():
     print()
 
     # Check if hook_results are in the response (Portkey adds this)
-    if hasattr(response, 'hook_results'):
-        print("Plugin executed:", response.hook_results)
+    hook_results = getattr(response, 'hook_results', None)
+    if hook_results is not None:
+        print("Plugin executed:", hook_results)
 
 
 if __name__ == "__main__":
@@ -5,29 +5,142 @@ This is a lower-level approach if you don't want to use OpenAI SDK
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import re
+
+try:
+    # Optional: orjson decodes noticeably faster than the standard library
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Reuse one session across calls so keep-alive connections to the gateway
+# are pooled instead of opening a new TCP connection per request
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+session.mount("http://", adapter)
+session.mount("https://", adapter)
+
+URL = "http://localhost:8787/v1/chat/completions"
+
+# Configuration goes in the header. The configs are static, so serialize
+# them once at import instead of on every call.
+HEADERS = {
+    "Content-Type": "application/json",
+    "x-portkey-config": json.dumps({
+        "provider": "openai",
+        "api_key": "dummy-key",
+        "custom_host": "http://localhost:8108/v1",
+        "inputMutators": [{
+            "langfuse.itsHub": {
+                "budget": 2
+            }
+        }]
+    })
+}
+
+RETRY_HEADERS = {
+    "Content-Type": "application/json",
+    "x-portkey-config": json.dumps({
+        "provider": "openai",
+        "api_key": "dummy-key",
+        "custom_host": "http://localhost:8108/v1",
+        "retry": {
+            "attempts": 3  # Retry up to 3 times on failure
+        },
+        "inputMutators": [{
+            "langfuse.itsHub": {
+                "budget": 2
+            }
+        }]
+    })
+}
+
+# SSE framing markers, kept as bytes so lines never need decoding
+SSE_EVENT_SEPARATOR = b'\n\n'
+SSE_DATA_PREFIX = b'data: '
+SSE_DONE = b'[DONE]'
+# The gateway streams with chunked transfer encoding, so each read returns as
+# soon as a chunk arrives; a large size only caps how much is taken per read
+STREAM_CHUNK_SIZE = 65536
+
+# Matches the delta text in a chat completion chunk without decoding the
+# whole chunk. The match cannot cross a brace, so it only ever finds a
+# "content" key of the delta object itself. Group 1 is the raw (still
+# JSON-escaped) string body.
+DELTA_CONTENT_RE = re.compile(
+    rb'"delta"\s*:\s*\{[^{}]*?"content"\s*:\s*"((?:[^"\\]|\\.)*)"'
+)
+
+
+def iter_sse_data(response):
+    """Yield the payload of each SSE data line in a streamed response
+
+    Raw blocks are appended to a single reusable buffer and complete events
+    are cut off its front, instead of building a new object per line.
+    """
+
+    buffer = bytearray()
+    for block in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        buffer += block
+        while (end := buffer.find(SSE_EVENT_SEPARATOR)) != -1:
+            event = buffer[:end]
+            del buffer[:end + len(SSE_EVENT_SEPARATOR)]
+            yield from sse_event_data(event)
+    if buffer:
+        yield from sse_event_data(buffer)
+
+
+def sse_event_data(event):
+    """Yield the data payloads of one SSE event, skipping the [DONE] marker"""
+
+    for line in event.splitlines():
+        if not line.startswith(SSE_DATA_PREFIX):
+            continue
+        data_bytes = line[len(SSE_DATA_PREFIX):]
+        if data_bytes.strip() != SSE_DONE:
+            yield data_bytes
+
+
+def extract_delta_content(data_bytes):
+    r"""Return the delta content of a streamed chunk, or None if it has none
+
+    >>> extract_delta_content(b'{"choices":[{"delta":{"content":"Hi"}}]}')
+    'Hi'
+    >>> extract_delta_content(b'{"choices":[{"delta":{"content":"a\\nb"}}]}')
+    'a\nb'
+    >>> extract_delta_content(
+    ...     b'{"choices":[{"delta":{"content":null}}],"usage":{"content":"x"}}'
+    ... ) is None
+    True
+    >>> extract_delta_content(b'{"choices":[{"delta":{"content":"\\q"}}]}') is None
+    True
+    """
+
+    start = data_bytes.find(b'"delta"')
+    if start == -1:
+        return None
+    match = DELTA_CONTENT_RE.search(data_bytes, start)
+    try:
+        if match is None:
+            # No plain string content in the delta (null content, nested
+            # objects such as tool calls); fall back to a full parse
+            chunk = json_loads(data_bytes)
+            return chunk['choices'][0]['delta'].get('content')
+        raw = match.group(1)
+        if b'\\' in raw:
+            # Let the JSON decoder handle escape sequences
+            return json_loads(b'"' + raw + b'"')
+        return raw.decode('utf-8')
+    except (json.JSONDecodeError, KeyError, IndexError):
+        return None
 
 
 def call_portkey_itshub():
     """Call ITS-Hub through Portkey using requests library"""
 
-    url = "http://localhost:8787/v1/chat/completions"
-
-    # Configuration goes in the header
-    headers = {
-        "Content-Type": "application/json",
-        "x-portkey-config": json.dumps({
-            "provider": "openai",
-            "api_key": "dummy-key",
-            "custom_host": "http://localhost:8108/v1",
-            "inputMutators": [{
-                "langfuse.itsHub": {
-                    "budget": 2
-                }
-            }]
-        })
-    }
-
     # Request body
     data = {
         "model": "gpt-4.1",
@@ -37,11 +150,11 @@ def call_portkey_itshub():
     }
 
     # Make the request
-    response = requests.post(url, headers=headers, json=data)
+    response = session.post(URL, headers=HEADERS, json=data)
 
     # Parse response
     if response.status_code == 200:
-        result = response.json()
+        result = json_loads(response.content)
         print("Success!")
         print(f"Response: {result['choices'][0]['message']['content']}")
         print()
@@ -63,25 +176,6 @@ def call_portkey_itshub():
 def call_portkey_with_retry():
     """Example with Portkey's retry feature"""
 
-    url = "http://localhost:8787/v1/chat/completions"
-
-    headers = {
-        "Content-Type": "application/json",
-        "x-portkey-config": json.dumps({
-            "provider": "openai",
-            "api_key": "dummy-key",
-            "custom_host": "http://localhost:8108/v1",
-            "retry": {
-                "attempts": 3  # Retry up to 3 times on failure
-            },
-            "inputMutators": [{
-                "langfuse.itsHub": {
-                    "budget": 2
-                }
-            }]
-        })
-    }
-
     data = {
         "model": "gpt-4.1",
         "messages": [
@@ -89,8 +183,8 @@ def call_portkey_with_retry():
         ]
     }
 
-    response = requests.post(url, headers=headers, json=data)
-    result = response.json()
+    response = session.post(URL, headers=RETRY_HEADERS, json=data)
+    result = json_loads(response.content)
 
     print("Response with Retry Config:")
     print(result['choices'][0]['message']['content'])
@@ -99,22 +193,6 @@ def call_portkey_with_retry():
 def call_portkey_streaming():
     """Example with streaming response"""
 
-    url = "http://localhost:8787/v1/chat/completions"
-
-    headers = {
-        "Content-Type": "application/json",
-        "x-portkey-config": json.dumps({
-            "provider": "openai",
-            "api_key": "dummy-key",
-            "custom_host": "http://localhost:8108/v1",
-            "inputMutators": [{
-                "langfuse.itsHub": {
-                    "budget": 2
-                }
-            }]
-        })
-    }
-
     data = {
         "model": "gpt-4.1",
         "messages": [
@@ -124,20 +202,12 @@ def call_portkey_streaming():
     }
 
     print("Streaming response:")
-    response = requests.post(url, headers=headers, json=data, stream=True)
-
-    for line in response.iter_lines():
-        if line:
-            line_str = line.decode('utf-8')
-            if line_str.startswith('data: '):
-                data_str = line_str[6:]  # Remove 'data: ' prefix
-                if data_str.strip() != '[DONE]':
-                    try:
-                        chunk = json.loads(data_str)
-                        if chunk['choices'][0]['delta'].get('content'):
-                            print(chunk['choices'][0]['delta']['content'], end='', flush=True)
-                    except json.JSONDecodeError:
-                        pass
+    response = session.post(URL, headers=HEADERS, json=data, stream=True)
+
+    for data_bytes in iter_sse_data(response):
+        content = extract_delta_content(data_bytes)
+        if content:
+            print(content, end='', flush=True)
     print("\n")
 
 